@@ -20,13 +20,15 @@ from kumacub import config
 from kumacub.application.services import runner
 from kumacub.infrastructure import executors, parsers, publishers
 
+_logger = structlog.get_logger(__name__)
+
 
 class KumaCubDaemon:
     """Main daemon class for KumaCub."""
 
     def __init__(self) -> None:
         """Initialize the KumaCub daemon."""
-        self._logger = structlog.get_logger()
+        self._publishers: dict[str, publishers.PublisherP] = {}
         self._scheduler = AsyncIOScheduler()
         self._settings = config.get_settings()
         self._stop_event = asyncio.Event()
@@ -42,7 +44,7 @@ class KumaCubDaemon:
             runner_ = runner.Runner(
                 executor=executors.get_executor(check.executor.name),
                 parser=parsers.get_parser(check.parser.name),
-                publisher=publishers.get_publisher(check.publisher.name),
+                publisher=self._get_publisher(check.publisher.name),
             )
             self._scheduler.add_job(
                 func=runner_.run,
@@ -53,6 +55,12 @@ class KumaCubDaemon:
                 next_run_time=dt.datetime.now(dt.UTC) + dt.timedelta(seconds=index * 2),
             )
 
+    def _get_publisher(self, name: str) -> publishers.PublisherP:
+        """Return the publisher for the given name, shared by all checks (and kept across reloads)."""
+        if name not in self._publishers:
+            self._publishers[name] = publishers.get_publisher(name)
+        return self._publishers[name]
+
     def _setup_signal_handlers(self) -> None:
         """Set up signal handlers for graceful shutdown and reload."""
         loop = asyncio.get_running_loop()
@@ -66,7 +74,7 @@ class KumaCubDaemon:
         if hasattr(signal, "SIGHUP"):
 
             def on_sighup() -> None:
-                self._logger.info("Reloading configuration...")
+                _logger.info("Reloading configuration...")
                 self._settings = config.reload_settings()
                 self._schedule_all_checks()
 
@@ -82,6 +90,8 @@ class KumaCubDaemon:
         try:
             await self._stop_event.wait()
         finally:
-            self._logger.info("Shutting down...")
+            _logger.info("Shutting down...")
             if self._scheduler:
                 self._scheduler.shutdown()
+            for publisher in self._publishers.values():
+                await publisher.aclose()
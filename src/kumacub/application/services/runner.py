@@ -34,11 +34,11 @@ class Runner:
         self._executor = executor
         self._parser = parser
         self._publisher = publisher
-        self._start_time: float | None = None
 
     async def run(self, check: models.Check) -> None:
         """Execute a check and publish the result."""
-        self._timer()
+        # Timing is kept local (not on the instance) so concurrent runs cannot interfere with each other.
+        start_ns = time.perf_counter_ns()
 
         # Stage 1: Execute
         executor_args = executors.ProcessExecutorArgs(
@@ -46,6 +46,7 @@ class Runner:
             command=check.executor.command,
             args=check.executor.args,
             env=check.executor.env,
+            timeout=check.executor.timeout,
         )
         executor_output = await self._executor.run(executor_args)
 
@@ -64,12 +65,6 @@ class Runner:
             parser_name=check.parser.name,
             publisher_name=check.publisher.name,
             check=check,
-            ping=self._timer(),
+            ping=(time.perf_counter_ns() - start_ns) / 1_000_000,
         )
         await self._publisher.publish(args=publisher_args)
-
-    def _timer(self) -> float:
-        """Return the elapsed time (in milliseconds) since the timer started and reset the timer."""
-        result = (time.time() - self._start_time) * 1000 if self._start_time is not None else 0.0
-        self._start_time = time.time()
-        return result
@@ -88,6 +88,7 @@ class LogSettings(pydantic.BaseModel):
 
     level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
     structured: bool = True
+    callsite: bool = False
 
 
 class Settings(pydantic_settings.BaseSettings):
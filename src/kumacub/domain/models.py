@@ -25,6 +25,7 @@ class Executor(pydantic.BaseModel):
     command: str = pydantic.Field(min_length=1)
     args: list[str] = []
     env: dict[str, str] = {}
+    timeout: pydantic.PositiveFloat = 60
 
 
 class Parser(pydantic.BaseModel):
@@ -164,21 +164,44 @@ class KumaCubCLI:
     @staticmethod
     def _run_checks() -> None:
         """Run checks."""
+        asyncio.run(KumaCubCLI._run_checks_concurrently())
+
+    @staticmethod
+    async def _run_checks_concurrently() -> None:
+        """Run all checks concurrently on one event loop, printing their results to stdout.
+
+        A failing check does not stop the others; failures are reported on stderr and the exit status is non-zero.
+        """
         settings = config.get_settings()
+        publisher = publishers.get_publisher("stdout")
+        runs = []
         for check in settings.checks:
             check_ = check.model_copy(update={"publisher": check.publisher.model_copy(update={"name": "stdout"})})
             runner_ = runner.Runner(
                 executor=executors.get_executor(check_.executor.name),
                 parser=parsers.get_parser(check_.parser.name),
-                publisher=publishers.get_publisher(check_.publisher.name),
+                publisher=publisher,
             )
-            asyncio.run(runner_.run(check_))
+            runs.append(runner_.run(check_))
+        try:
+            results = await asyncio.gather(*runs, return_exceptions=True)
+        finally:
+            await publisher.aclose()
+
+        failures = 0
+        for check, result in zip(settings.checks, results, strict=True):
+            if isinstance(result, BaseException):
+                failures += 1
+                print(f"Error: check {check.name} failed: {result!r}", file=sys.stderr)
+        if failures:
+            msg = f"{failures} of {len(results)} checks failed"
+            raise SystemExit(msg)
 
 
 def main() -> None:
     """Entry point for the kumacub command."""
     settings = config.get_settings()
-    configure_logging(level=settings.log.level, structured=settings.log.structured)
+    configure_logging(level=settings.log.level, structured=settings.log.structured, callsite=settings.log.callsite)
 
     cli = KumaCubCLI()
     cli.main()
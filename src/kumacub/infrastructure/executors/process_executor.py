@@ -10,11 +10,18 @@
 """Process executor."""
 
 import asyncio
-from typing import ClassVar
+import concurrent.futures
+import subprocess
+from typing import ClassVar, Final
 
 import pydantic
 import structlog
 
+_logger = structlog.get_logger(__name__)
+
+# Exit code reported for a check that timed out; 3 is UNKNOWN in the Nagios plugin API.
+_TIMEOUT_EXIT_CODE: Final = 3
+
 
 class ProcessExecutorArgs(pydantic.BaseModel):
     """Process executor args."""
@@ -25,6 +32,8 @@ class ProcessExecutorArgs(pydantic.BaseModel):
     command: str = pydantic.Field(min_length=1)
     args: list[str] = []
     env: dict[str, str] = {}
+    # Seconds before the process is killed. Shutdown waits for a running check to finish, so it can take this long.
+    timeout: pydantic.PositiveFloat = 60
 
 
 class ProcessExecutorOutput(pydantic.BaseModel):
@@ -42,22 +51,30 @@ class _ProcessExecutor:
 
     name: ClassVar[str] = "process"
 
-    @staticmethod
-    async def run(args: ProcessExecutorArgs) -> ProcessExecutorOutput:
+    def __init__(self) -> None:
+        """Initialize the executor."""
+        # Each check gets its own executor, so this dedicates one worker thread per configured check: checks never
+        # wait for a free thread in the event loop's shared default pool, and that wait never counts toward the ping.
+        # The thread is started on first use and exits once the executor is garbage-collected.
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="kumacub-check")
+
+    async def run(self, args: ProcessExecutorArgs) -> ProcessExecutorOutput:
         """Run a check and return the result."""
-        logger = structlog.get_logger().bind(id=args.id)
+        logger = _logger.bind(id=args.id)
         logger.info("Running check")
 
-        proc = await asyncio.create_subprocess_exec(
-            args.command,
-            *args.args,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=args.env,
-        )
-        stdout_data, stderr_data = await proc.communicate()
-        stdout = stdout_data.decode().strip()
-        stderr = stderr_data.decode().strip()
+        # Run the blocking subprocess call in a worker thread; this skips asyncio's subprocess transport and
+        # child-watcher machinery, which is costly for short-lived checks.
+        try:
+            proc = await asyncio.get_running_loop().run_in_executor(self._pool, _run_process, args)
+        except subprocess.TimeoutExpired:
+            # The process has been killed; report a result rather than failing the whole run.
+            logger.warning("Check timed out", timeout=args.timeout)
+            return ProcessExecutorOutput(
+                stdout="", stderr=f"Check timed out after {args.timeout:g} seconds", exit_code=_TIMEOUT_EXIT_CODE
+            )
+        stdout = _decode(proc.stdout)
+        stderr = _decode(proc.stderr)
 
         if proc.returncode != 0:
             logger.warning("Check failed", exit_code=proc.returncode)
@@ -69,3 +86,19 @@ class _ProcessExecutor:
             logger.warning("Check output", stderr=stderr)
 
         return ProcessExecutorOutput(stdout=stdout, stderr=stderr, exit_code=proc.returncode or 0)
+
+
+def _run_process(args: ProcessExecutorArgs) -> subprocess.CompletedProcess[bytes]:
+    """Run the check process to completion, capturing its output."""
+    return subprocess.run(  # noqa: S603 - Commands come from the (trusted) configuration; no shell is involved.
+        [args.command, *args.args],
+        capture_output=True,
+        check=False,
+        env=args.env,
+        timeout=args.timeout,
+    )
+
+
+def _decode(data: bytes) -> str:
+    """Decode captured process output in a single pass; invalid UTF-8 is replaced rather than raised."""
+    return data.decode(errors="replace").strip() if data else ""
@@ -11,6 +11,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING, ClassVar, Final, Protocol
 
 from .nagios import NagiosParserArgs, NagiosParserOutput, _NagiosParser
@@ -38,8 +39,9 @@ class ParserP(Protocol):
         """Parse raw process output into a structured model."""
 
 
+@functools.cache
 def get_parser(name: str) -> ParserP:
-    """Construct a parser by name."""
+    """Return the parser for the given name; parsers are stateless, so one instance per name is shared."""
     try:
         return _REGISTRY[name]()
     except KeyError as e:
@@ -17,6 +17,12 @@ import pydantic
 import structlog
 
 NagiosExitCode = Literal[0, 1, 2, 3]
+NagiosServiceState = Literal["OK", "WARNING", "CRITICAL", "UNKNOWN"]
+
+# Service states indexed by exit code; exit codes are validated to 0-3, so indexing cannot fail.
+_STATES: Final[tuple[NagiosServiceState, ...]] = ("OK", "WARNING", "CRITICAL", "UNKNOWN")
+
+_logger = structlog.get_logger(__name__)
 
 
 class NagiosParserArgs(pydantic.BaseModel):
@@ -34,7 +40,7 @@ class NagiosParserOutput(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(frozen=True)
 
-    service_state: Literal["OK", "WARNING", "CRITICAL", "UNKNOWN"]
+    service_state: NagiosServiceState
     exit_code: NagiosExitCode
     service_output: str
     long_service_output: str
@@ -46,56 +52,62 @@ class _NagiosParser:
 
     name: ClassVar[str] = "nagios"
 
-    _STATE_MAP: Final[dict[int, Literal["OK", "WARNING", "CRITICAL", "UNKNOWN"]]] = {
-        0: "OK",
-        1: "WARNING",
-        2: "CRITICAL",
-        3: "UNKNOWN",
-    }
-
     def parse(self, args: NagiosParserArgs) -> NagiosParserOutput:
         """Parse the raw output into the parser-specific model."""
-        logger = structlog.get_logger().bind(id=args.id)
+        logger = _logger.bind(id=args.id)
         service_output = ""
         long_service_output = ""
         service_performance_data = ""
 
-        lines = [line.strip() for line in args.output.splitlines() if line.strip()]
-        if lines:
-            performance_data = ""
-            service_output = lines.pop(0)
-
-            if "|" in service_output:
-                service_output, performance_data = (part.strip() for part in service_output.split("|", 1))
+        # Lazily yield non-empty, stripped lines so large outputs are not copied into an intermediate list.
+        lines = (stripped for line in args.output.splitlines() if (stripped := line.strip()))
+        service_output = next(lines, "")
+        if service_output:
+            service_output, _, performance_data = service_output.partition("|")
+            service_output = service_output.rstrip()
+            performance_data = performance_data.lstrip()
 
             long_text_lines: list[str] = []
             performance_data_parts: list[str] = []
-            in_performance_data = False
 
             if performance_data:
                 performance_data_parts.append(performance_data)
 
+            # Long text lines run until the first line containing a pipe; everything after it is performance data.
+            # Both loops consume the same iterator, so no per-line state flag is needed.
             for line in lines:
-                if "|" in line:
-                    text_part, perf_part = (part.strip() for part in line.split("|", 1))
-                    if text_part:
-                        long_text_lines.append(text_part)
-                    performance_data_parts.append(perf_part)
-                    in_performance_data = True
-                elif in_performance_data and line and not line.startswith((" ", "\t")):
-                    performance_data_parts.append(line)
+                text_part, sep, perf_part = line.partition("|")
+                if sep:
+                    self._add_parts(text_part, perf_part, long_text_lines, performance_data_parts)
+                    break
+                long_text_lines.append(line)
+
+            for line in lines:
+                text_part, sep, perf_part = line.partition("|")
+                if sep:
+                    self._add_parts(text_part, perf_part, long_text_lines, performance_data_parts)
                 else:
-                    long_text_lines.append(line)
-                    in_performance_data = False
+                    performance_data_parts.append(line)
 
             service_performance_data = " ".join(filter(None, performance_data_parts))
             long_service_output = "\n".join(long_text_lines)
 
         logger.debug("Parsed Nagios output", exit_code=args.exit_code, service_output=service_output)
-        return NagiosParserOutput(
-            service_state=self._STATE_MAP.get(args.exit_code, "UNKNOWN"),
+        # Every field is derived from validated args, so skip re-validating them.
+        return NagiosParserOutput.model_construct(
+            service_state=_STATES[args.exit_code],
             exit_code=args.exit_code,
             service_output=service_output,
             long_service_output=long_service_output,
             service_performance_data=service_performance_data,
         )
+
+    @staticmethod
+    def _add_parts(
+        text_part: str, perf_part: str, long_text_lines: list[str], performance_data_parts: list[str]
+    ) -> None:
+        """Add the text and performance data parts of a line that was partitioned on a pipe."""
+        # The line itself is already stripped, so only the sides facing the pipe need trimming.
+        if text_part := text_part.rstrip():
+            long_text_lines.append(text_part)
+        performance_data_parts.append(perf_part.lstrip())
@@ -33,6 +33,9 @@ class PublisherP(Protocol):
 
     name: ClassVar[str] = ""
 
+    async def aclose(self) -> None:
+        """Release any resources (e.g., HTTP connections) held by the publisher."""
+
     async def publish(self, args: pydantic.BaseModel) -> None:
         """Publish check results to the external service.
 
@@ -9,6 +9,7 @@
 
 """Stdout publisher."""
 
+import sys
 from typing import ClassVar, Literal
 
 import pydantic
@@ -29,7 +30,18 @@ class _StdoutPublisher:
 
     name: ClassVar[str] = "stdout"
 
-    @staticmethod
-    async def publish(args: StdoutPublishArgs) -> None:
+    def __init__(self, indent: int | None = None) -> None:
+        """Initialize the publisher.
+
+        Args:
+            indent: Optional JSON indentation; by default, results are written as compact single-line JSON.
+        """
+        self._indent = indent
+
+    async def aclose(self) -> None:
+        """Release publisher resources (none are held)."""
+
+    async def publish(self, args: StdoutPublishArgs) -> None:
         """Publish a check result to stdout."""
-        print(args.model_dump_json(indent=2))
+        sys.stdout.write(args.model_dump_json(indent=self._indent))
+        sys.stdout.write("\n")
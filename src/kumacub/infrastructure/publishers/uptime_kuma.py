@@ -9,12 +9,21 @@
 
 """Uptime Kuma publisher."""
 
-from typing import ClassVar, Literal
+import importlib.util
+from typing import ClassVar, Final, Literal
 
 import httpx
 import pydantic
 import structlog
 
+_logger = structlog.get_logger(__name__)
+_HEADERS: Final = {"Accept": "application/json"}
+_QUERY_FIELDS: Final = {"status", "msg", "ping"}
+
+# HTTP/2 needs the optional h2 package (the http2 extra); without it, pushes use HTTP/1.1 keep-alive connections.
+_HTTP2: Final = importlib.util.find_spec("h2") is not None
+_LIMITS: Final = httpx.Limits(max_keepalive_connections=10, max_connections=20, keepalive_expiry=30.0)
+
 
 class UptimeKumaPublishArgs(pydantic.BaseModel):
     """Arguments for the publisher."""
@@ -28,39 +37,68 @@ class UptimeKumaPublishArgs(pydantic.BaseModel):
     msg: str = pydantic.Field(default="", max_length=250)
     ping: pydantic.PositiveFloat | None
 
+    def query_params(self) -> dict[str, str | float]:
+        """Return the push query parameters (status, msg, ping).
+
+        Only the query fields are serialized, so the URL and push token are not dumped just to be filtered out.
+        """
+        return self.model_dump(mode="json", include=_QUERY_FIELDS, exclude_none=True, exclude_unset=True)
+
 
 class _UptimeKumaPublisher:
     """Uptime Kuma publisher implementing the publisher protocol."""
 
     name: ClassVar[str] = "uptime_kuma"
 
-    @staticmethod
-    async def publish(args: UptimeKumaPublishArgs) -> None:
+    def __init__(self) -> None:
+        """Initialize the publisher."""
+        self._client: httpx.AsyncClient | None = None
+
+    async def aclose(self) -> None:
+        """Close the HTTP client (and its pooled connections)."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def publish(self, args: UptimeKumaPublishArgs) -> None:
         """Publish a check result to Uptime Kuma."""
-        logger = structlog.get_logger().bind(id=args.id)
+        logger = _logger.bind(id=args.id)
         url = f"{args.url}api/push/{args.push_token.get_secret_value()}"
-        params = {
-            k: v
-            for k, v in args.model_dump(mode="json", exclude_none=True, exclude_unset=True).items()
-            if k in {"status", "msg", "ping"}
-        }
+        params = args.query_params()
         logger.debug("Pushing check result to Uptime Kuma", url=url, params=params)
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url=url,
-                    params=params,
-                    headers={"Accept": "application/json"},
-                    follow_redirects=True,
-                    timeout=10.0,
-                )
-                response.raise_for_status()
-                logger.debug("Successfully pushed check result to Uptime Kuma")
+            response = await self._get_client().get(url=url, params=params)
+            response.raise_for_status()
+            logger.debug("Successfully pushed check result to Uptime Kuma")
 
         except httpx.HTTPStatusError as e:
-            error_msg = e.response.json().get("msg", f"Server returned error: {e.response.status_code}")
+            error_msg = self._error_message(e.response)
             logger.warning("Failed to push check result: %s", error_msg)
 
         except httpx.RequestError as e:
             error_msg = f"Request failed: {e!s}"
             logger.warning("Failed to push check result: %s", error_msg)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the HTTP client, creating it on first use.
+
+        The client is kept for the lifetime of the publisher so pushes reuse pooled (keep-alive) connections rather
+        than paying a new TCP/TLS handshake each time. With HTTP/2 available, concurrent pushes are multiplexed over
+        one connection; servers that only speak HTTP/1.1 are negotiated down automatically.
+        """
+        if self._client is None:
+            # No custom transport: httpx only honours proxy environment variables (HTTPS_PROXY etc.) without one.
+            self._client = httpx.AsyncClient(
+                headers=_HEADERS, follow_redirects=True, timeout=10.0, http2=_HTTP2, limits=_LIMITS
+            )
+        return self._client
+
+    @staticmethod
+    def _error_message(response: httpx.Response) -> str:
+        """Return the error message from an error response, falling back to the status code."""
+        default = f"Server returned error: {response.status_code}"
+        try:
+            body = response.json()
+        except ValueError:  # Includes json.JSONDecodeError for non-JSON (e.g., HTML proxy) error pages.
+            return default
+        return str(body.get("msg", default)) if isinstance(body, dict) else default
@@ -15,25 +15,113 @@ integrates structlog with contextvars for per-request context.
 
 from __future__ import annotations
 
+import datetime as dt
+import json
 import logging
 import logging.config
-from typing import Final
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Final
 
 import structlog
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 DEFAULT_LEVEL: Final[str] = "INFO"
 
+_CALLSITE_PARAMS: Final = frozenset(
+    {
+        structlog.processors.CallsiteParameter.FUNC_NAME,
+        structlog.processors.CallsiteParameter.LINENO,
+        structlog.processors.CallsiteParameter.PROCESS,
+        structlog.processors.CallsiteParameter.THREAD,
+    }
+)
+
+_CALLSITE_ADDER: Final = structlog.processors.CallsiteParameterAdder(_CALLSITE_PARAMS)
+
+# Record attribute holding the caller's structlog contextvars, captured before a foreign record is queued.
+_CONTEXTVARS_ATTR: Final = "_kumacub_contextvars"
+
+# Foreign (stdlib) records run through the pre-chain on the listener thread, so the processors below take anything
+# that depends on the calling thread (contextvars, creation time, process/thread IDs) from the record instead.
+
+
+def _merge_contextvars(
+    logger: structlog.types.WrappedLogger, method_name: str, event_dict: structlog.types.EventDict
+) -> structlog.types.EventDict:
+    """Merge the caller's structlog contextvars into the event."""
+    record = event_dict.get("_record")
+    if record is None:
+        return structlog.contextvars.merge_contextvars(logger, method_name, event_dict)
+    for key, value in getattr(record, _CONTEXTVARS_ATTR, {}).items():
+        event_dict.setdefault(key, value)
+    return event_dict
+
+
+def _event_time(event_dict: structlog.types.EventDict) -> float:
+    """Return when the event was logged: the record's creation time for foreign records, otherwise now."""
+    record = event_dict.get("_record")
+    return time.time() if record is None else float(record.created)
+
+
+def _add_epoch_timestamp(
+    _logger: structlog.types.WrappedLogger, _method_name: str, event_dict: structlog.types.EventDict
+) -> structlog.types.EventDict:
+    """Add a UNIX timestamp (cheap to produce and parse, for JSON logs)."""
+    event_dict["timestamp"] = _event_time(event_dict)
+    return event_dict
+
+
+def _add_iso_timestamp(
+    _logger: structlog.types.WrappedLogger, _method_name: str, event_dict: structlog.types.EventDict
+) -> structlog.types.EventDict:
+    """Add an ISO-8601 UTC timestamp (for human-readable console logs)."""
+    timestamp = dt.datetime.fromtimestamp(_event_time(event_dict), tz=dt.UTC)
+    event_dict["timestamp"] = timestamp.isoformat().replace("+00:00", "Z")
+    return event_dict
+
+
+def _resolve_exc_info(
+    _logger: structlog.types.WrappedLogger, _method_name: str, event_dict: structlog.types.EventDict
+) -> structlog.types.EventDict:
+    """Replace exc_info=True (set by log.exception()) with the current exception while still on the calling thread."""
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
+
 
-def configure_logging(level: str = DEFAULT_LEVEL, *, structured: bool = True) -> None:
+# Processors are stateless, so the shared chain is built once and reused by every configure_logging() call.
+_SHARED_PROCESSORS: Final[tuple[structlog.types.Processor, ...]] = (
+    _merge_contextvars,
+    structlog.stdlib.add_logger_name,
+    structlog.processors.add_log_level,
+)
+
+
+def configure_logging(level: str = DEFAULT_LEVEL, *, structured: bool = True, callsite: bool = False) -> None:
     """Configure logging for the application.
 
     - Routes stdlib logging through structlog's ProcessorFormatter
     - Renders JSON by default (suitable for production/log aggregation)
     - Merges contextvars (request_id, method, path, etc.) into each event
+    - Renders and writes on a background listener thread; callers only enqueue records
 
     Args:
         level: Log level name (e.g., "DEBUG"). Defaults to INFO.
         structured: If True, render JSON; otherwise use a developer-friendly console renderer.
+        callsite: If True, add the function name and line number to each event. This inspects the call stack on
+            every log call, so it is off by default; the process and thread IDs are always added.
 
     Usage:
     - Call early in the HTTP entrypoint (see `entrypoints/http_server.py`).
@@ -41,29 +129,30 @@ def configure_logging(level: str = DEFAULT_LEVEL, *, structured: bool = True) ->
     - Middleware (`RequestContextMiddleware`) injects request fields; they appear
       on every log line.
     """
-    numeric_level = logging.getLevelNamesMapping().get(level.upper(), logging.INFO)
-
-    shared_processors = [
-        structlog.contextvars.merge_contextvars,
-        structlog.stdlib.add_logger_name,
-        structlog.processors.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso", utc=True),
-        structlog.processors.CallsiteParameterAdder(
-            {
-                structlog.processors.CallsiteParameter.FUNC_NAME,
-                structlog.processors.CallsiteParameter.LINENO,
-                structlog.processors.CallsiteParameter.PROCESS,
-                structlog.processors.CallsiteParameter.THREAD,
-            }
-        ),
-    ]
-
-    # Choose renderer based on the "structured" option
+    # getLevelName() maps a known level name to its number (without copying the name mapping, as
+    # getLevelNamesMapping() does) and returns a "Level ..." string for unknown names.
+    numeric_level = logging.getLevelName(level.upper())
+    if not isinstance(numeric_level, int):
+        numeric_level = logging.INFO
+
+    # Choose renderer (and pre-chain) based on the "structured" option. The pre-chain is an immutable tuple, so the
+    # structlog pipeline and the ProcessorFormatter's foreign_pre_chain never alias a shared, mutated list.
+    pre_chain: tuple[structlog.types.Processor, ...] = (
+        *_SHARED_PROCESSORS,
+        _add_epoch_timestamp if structured else _add_iso_timestamp,
+        _CALLSITE_ADDER if callsite else _add_process_and_thread,
+    )
     renderer: structlog.types.Processor
     if structured:
-        shared_processors.append(structlog.processors.format_exc_info)
-        renderer = structlog.processors.JSONRenderer()
+        pre_chain = (*pre_chain, structlog.processors.format_exc_info)
+        renderer = (
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+            if orjson
+            else structlog.processors.JSONRenderer()
+        )
     else:
+        # ConsoleRenderer formats exceptions itself, but only after the event reaches the listener thread.
+        pre_chain = (*pre_chain, _resolve_exc_info)
         renderer = structlog.dev.ConsoleRenderer()
 
     # Reset structlog to avoid cached loggers keeping stale processors
@@ -73,32 +162,92 @@ def configure_logging(level: str = DEFAULT_LEVEL, *, structured: bool = True) ->
     structlog.configure(
         cache_logger_on_first_use=True,
         logger_factory=structlog.stdlib.LoggerFactory(),
-        processors=[
-            *shared_processors,  # type: ignore[list-item]
-            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
-        ],
+        processors=[*pre_chain, structlog.stdlib.ProcessorFormatter.wrap_for_formatter],
         wrapper_class=structlog.make_filtering_bound_logger(numeric_level),
     )
 
     # ProcessorFormatter for stdlib logs (incl. uvicorn, fastapi, httpx, etc.)
     processor_formatter = structlog.stdlib.ProcessorFormatter(
         processor=renderer,
-        foreign_pre_chain=shared_processors,  # type: ignore[arg-type]
+        foreign_pre_chain=pre_chain,
     )
 
     handler = logging.StreamHandler()
     handler.setFormatter(processor_formatter)
     handler.setLevel(numeric_level)
 
-    # Apply to root logger and common libraries
+    # Apply to root logger and common libraries; rendering and writing happen on a background listener thread.
     root = logging.getLogger()
+    for old_handler in root.handlers:
+        if isinstance(old_handler, _QueueHandler):
+            old_handler.close()
     root.handlers.clear()
-    root.addHandler(handler)
+    root.addHandler(_QueueHandler(queue.SimpleQueue(), handler))
     root.setLevel(numeric_level)
 
     for name in ("apscheduler", "httpx"):
-        logging.getLogger(name).setLevel(numeric_level)
-        logging.getLogger(name).propagate = True
+        logger = logging.getLogger(name)
+        logger.setLevel(numeric_level)
+        logger.propagate = True
+
+
+def _add_process_and_thread(
+    _logger: structlog.types.WrappedLogger, _method_name: str, event_dict: structlog.types.EventDict
+) -> structlog.types.EventDict:
+    """Add the process and thread IDs without the stack inspection done by CallsiteParameterAdder."""
+    record = event_dict.get("_record")
+    if record is not None:  # Foreign (stdlib) record, possibly processed on the listener thread.
+        event_dict["process"] = record.process
+        event_dict["thread"] = record.thread
+    else:
+        event_dict["process"] = os.getpid()
+        event_dict["thread"] = threading.get_ident()
+    return event_dict
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that owns a listener thread which renders and writes records with the given handler.
+
+    The stock QueueHandler formats each record on the calling thread (so it can be pickled), which would turn the
+    structlog event dict into a string before ProcessorFormatter sees it. This queue never leaves the process, so
+    records are enqueued as-is and all rendering happens on the listener thread.
+    """
+
+    def __init__(self, queue: queue.SimpleQueue[logging.LogRecord], handler: logging.Handler) -> None:
+        """Initialize the handler and start its listener."""
+        super().__init__(queue)
+        self._listener: logging.handlers.QueueListener | None = logging.handlers.QueueListener(
+            queue, handler, respect_handler_level=True
+        )
+        self._listener.start()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return the record unformatted; foreign records also get a snapshot of the caller's contextvars."""
+        if not hasattr(record, "_logger"):  # Not wrapped by structlog's wrap_for_formatter.
+            setattr(record, _CONTEXTVARS_ATTR, structlog.contextvars.get_contextvars())
+        return record
+
+    def close(self) -> None:
+        """Stop the listener (flushing queued records), then close the handler.
+
+        Called on reconfiguration and by logging.shutdown() at interpreter exit.
+        """
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+        super().close()
+
+
+def _orjson_dumps(obj: object, default: Callable[[Any], Any] | None = None, **_: object) -> str:
+    """Serialize a log event with orjson (which returns bytes) for the stdlib logging handler.
+
+    Non-string keys are stringified, as the stdlib json module does; anything else orjson rejects (such as integers
+    wider than 64 bits) falls back to the stdlib json module rather than losing the event.
+    """
+    try:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        return json.dumps(obj, default=default)
 
 
 __all__ = ["configure_logging"]
@@ -0,0 +1,16 @@
+#  KumaCub - Run local checks; push results to Uptime Kuma.
+#  Copyright (c) 2025-2026 Stephen T. Jibson.
+#  This program is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+#  License as published by the Free Software Foundation, version 3.
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+#  warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License along with this program.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Shared pytest configuration for the KumaCub test suite."""
+
+import os
+
+# Skip rendering documentation URLs into pydantic validation error messages; nothing in the tests asserts on them.
+os.environ.setdefault("PYDANTIC_ERRORS_INCLUDE_URL", "0")
@@ -0,0 +1,60 @@
+#  KumaCub - Run local checks; push results to Uptime Kuma.
+#  Copyright (c) 2025-2026 Stephen T. Jibson.
+#  This program is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+#  License as published by the Free Software Foundation, version 3.
+#  This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+#  warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License along with this program.
+#  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Tests for the command-line interface."""
+
+import asyncio
+import json
+import types
+
+import pytest
+from _pytest.capture import CaptureFixture
+
+from kumacub import config
+from kumacub.domain import models
+from kumacub.entrypoints.cli import KumaCubCLI
+from kumacub.infrastructure import executors
+
+
+class _FakeExecutor:
+    """Executor that fails the "bad" check and (slowly) passes every other check."""
+
+    name = "process"
+
+    async def run(self, args: executors.ProcessExecutorArgs) -> executors.ProcessExecutorOutput:
+        if args.id == "bad":
+            raise FileNotFoundError(args.command)
+        await asyncio.sleep(0.05)  # Still running when the bad check fails.
+        return executors.ProcessExecutorOutput(stdout="OK - fine", stderr="", exit_code=0)
+
+
+def _check(name: str) -> models.Check:
+    """Return a check with the given name that publishes to stdout."""
+    return models.Check(
+        name=name, executor=models.Executor(command=f"/usr/lib/{name}"), publisher=models.StdoutPublisher()
+    )
+
+
+def test_run_checks_reports_failures_after_all_checks_finish(
+    monkeypatch: pytest.MonkeyPatch, capsys: CaptureFixture[str]
+) -> None:
+    """Test that a failing check does not stop the others, is reported on stderr and makes the exit status non-zero."""
+    settings = types.SimpleNamespace(checks=[_check("bad"), _check("good")])
+    monkeypatch.setattr(config, "get_settings", lambda: settings)
+    monkeypatch.setattr(executors, "get_executor", lambda _name: _FakeExecutor())
+
+    with pytest.raises(SystemExit) as exc_info:
+        KumaCubCLI()._run_checks()
+
+    assert exc_info.value.code == "1 of 2 checks failed"
+    captured = capsys.readouterr()
+    published = [json.loads(line) for line in captured.out.splitlines() if line.startswith("{")]  # Skip log lines.
+    assert published == [{"id": "good", "status": "up", "msg": "OK - fine"}]
+    assert "Error: check bad failed: FileNotFoundError('/usr/lib/bad')" in captured.err
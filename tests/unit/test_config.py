@@ -15,9 +15,7 @@ import os
 import textwrap
 import typing
 from typing import TYPE_CHECKING
-from unittest.mock import patch
 
-import pydantic_settings
 import pytest
 
 from kumacub import config
@@ -32,6 +30,9 @@ if TYPE_CHECKING:
 # Fixtures and Utilities
 # ============================================================================
 
+# KUMACUB__ variables inherited from the outer environment; tests that set others always restore them.
+_KUMACUB_ENV_KEYS = frozenset(key for key in os.environ if key.startswith("KUMACUB__"))
+
 
 @pytest.fixture(autouse=True)
 def _reset_config_cache() -> Iterator[None]:
@@ -46,9 +47,21 @@ def _reset_config_cache() -> Iterator[None]:
 # ============================================================================
 
 
+# Checks are frozen, so one instance can be shared by every MockSettings.
+_MOCK_CHECK = Check(
+    name="test-check",
+    executor=Executor(command="echo"),
+    parser=Parser(),
+    publisher=StdoutPublisher(),
+    schedule=Schedule(interval=60),
+)
+
+
 class MockLogSettings:
     """Mock log settings for testing."""
 
+    __slots__ = ("level", "structured")
+
     def __init__(self) -> None:
         """Initialize mock log settings with default values."""
         self.level = "INFO"
@@ -58,20 +71,14 @@ class MockLogSettings:
 class MockSettings:
     """Mock settings for testing configuration loading."""
 
+    __slots__ = ("_env_overrides", "checks", "log")
+
     model_config: typing.ClassVar[dict[str, object]] = {}
 
     def __init__(self) -> None:
         """Initialize mock settings with default values."""
         self.log = MockLogSettings()
-        self.checks = [
-            Check(
-                name="test-check",
-                executor=Executor(command="echo"),
-                parser=Parser(),
-                publisher=StdoutPublisher(),
-                schedule=Schedule(interval=60),
-            )
-        ]
+        self.checks = [_MOCK_CHECK]  # Fresh list, shared (frozen) check.
 
         # Track environment overrides
         self._env_overrides: dict[str, object] = {}
@@ -84,16 +91,7 @@ class MockSettings:
         """
         return {
             "log": {"level": self.log.level, "structured": self.log.structured},
-            "checks": [
-                {
-                    "name": check.name,
-                    "executor": check.executor.model_dump(),
-                    "parser": check.parser.model_dump(),
-                    "publisher": check.publisher.model_dump(),
-                    "schedule": check.schedule.model_dump(),
-                }
-                for check in self.checks
-            ],
+            "checks": [check.model_dump() for check in self.checks],
         }
 
 
@@ -103,86 +101,33 @@ class MockSettings:
 
 
 @pytest.fixture
-def mock_settings(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+def mock_settings(monkeypatch: pytest.MonkeyPatch) -> None:
     """Mock the settings to avoid loading from a TOML file."""
     # Clear any existing environment variables that might interfere
-    for key in os.environ:
-        if key.startswith("KUMACUB__"):
-            monkeypatch.delenv(key, raising=False)
+    for key in _KUMACUB_ENV_KEYS:
+        monkeypatch.delenv(key, raising=False)
 
     # Create a real settings instance with our mock data
     settings = MockSettings()
 
-    # Patch the Settings class to return our mock
-    with patch("kumacub.config.Settings") as mock_settings_cls:
-        # Configure the mock to return our settings instance
-        mock_settings_cls.return_value = settings
-
-        # Also patch reload_settings to update our mock settings from environment
-        def reload_mock() -> MockSettings:
-            """Reload mock settings from environment variables.
-
-            Returns:
-                MockSettings: The updated settings instance.
-            """
-            # Update log level from environment if set
-            log_level = os.environ.get("KUMACUB__LOG__LEVEL")
-            if log_level:
-                settings.log.level = log_level
-            return settings
-
-        with (
-            patch("kumacub.config.reload_settings", side_effect=reload_mock),
-            patch("kumacub.config.get_settings", side_effect=reload_mock),
-        ):
-            yield
-
-
-@pytest.fixture
-def config_toml_file(tmp_path: Path) -> Iterator[Path]:
-    """Create a temporary config TOML file and set toml_file in model_config."""
-    toml = tmp_path / "cfg.toml"
-    toml.write_text(
-        textwrap.dedent(
-            """
-            service_name = "kumacub"
-            [log]
-            level = "DEBUG"
-            structured = false
+    def reload_mock() -> MockSettings:
+        """Reload mock settings from environment variables.
 
-            [[checks]]
-            name = "test-check"
-            executor.command = "echo"
-            executor.args = ["-n", "OK - Test is running"]
-            publisher.name = "stdout"
-            publisher.url = ""
-            publisher.push_token = ""
-            schedule.interval = 60
-            """
-        )
-    )
-
-    # Save the original model config
-    original_config = config.Settings.model_config
-
-    # Create a new model config with our test TOML file
-    new_config = pydantic_settings.SettingsConfigDict()
-
-    # Set the attributes from the original config
-    for key, value in original_config.items():
-        if key != "toml_file":
-            setattr(new_config, key, value)
-
-    # Set the test TOML file
-    new_config["toml_file"] = str(toml)
-
-    # Update the model config to use our test TOML file
-    config.Settings.model_config = new_config
-
-    yield toml
-
-    # Restore the original model config
-    config.Settings.model_config = original_config
+        Returns:
+            MockSettings: The updated settings instance.
+        """
+        # Update log level from environment if set
+        log_level = os.environ.get("KUMACUB__LOG__LEVEL")
+        if log_level:
+            settings.log.level = log_level
+        return settings
+
+    # Make the Settings class return our mock, and reload_settings/get_settings update it from the environment;
+    # there is no real cache to reset (monkeypatch restores the originals at teardown).
+    monkeypatch.setattr(config, "Settings", lambda: settings)
+    monkeypatch.setattr(config, "reload_settings", reload_mock)
+    monkeypatch.setattr(config, "get_settings", reload_mock)
+    monkeypatch.setattr(config, "reset_settings_cache", lambda: None)
 
 
 # ============================================================================
@@ -20,6 +20,12 @@ from kumacub.domain import models
 DEFAULT_INTERVAL: Final[int] = 60
 MAX_MSG_LENGTH: Final[int] = 250
 
+# SecretStr is immutable, so one instance can be shared.
+_TEST_TOKEN: Final = pydantic.SecretStr("test_token")
+
+# Frozen, so the Check tests can share it.
+_PUBLISHER: Final = models.UptimeKumaPublisher(url=pydantic.HttpUrl("https://my_url.net"), push_token=_TEST_TOKEN)
+
 
 class TestCheckModel:
     """Tests for the Check domain model."""
@@ -30,9 +36,7 @@ class TestCheckModel:
             name="test_check",
             executor=models.Executor(command="echo"),
             parser=models.Parser(),
-            publisher=models.UptimeKumaPublisher(
-                url=pydantic.HttpUrl("https://my_url.net"), push_token=pydantic.SecretStr("test_token")
-            ),
+            publisher=_PUBLISHER,
             schedule=models.Schedule(),
         )
         assert check.name == "test_check"
@@ -40,6 +44,7 @@ class TestCheckModel:
         assert check.executor.command == "echo"
         assert check.executor.args == []  # Default value
         assert check.executor.env == {}  # Default value
+        assert check.executor.timeout == 60  # Default value
         assert check.schedule.interval == DEFAULT_INTERVAL  # Default value
 
     def test_valid_check_with_all_fields(self) -> None:
@@ -50,9 +55,7 @@ class TestCheckModel:
                 command="/usr/local/bin/check_disk", args=["-w", "80%", "-c", "90%"], env={"PATH": "/usr/bin"}
             ),
             parser=models.Parser(),
-            publisher=models.UptimeKumaPublisher(
-                url=pydantic.HttpUrl("https://my_url.net"), push_token=pydantic.SecretStr("test_token")
-            ),
+            publisher=_PUBLISHER,
             schedule=models.Schedule(interval=30.5),
         )
         assert check.name == "full_check"
@@ -61,35 +64,18 @@ class TestCheckModel:
         assert check.executor.env == {"PATH": "/usr/bin"}
         assert check.schedule.interval == 30.5
 
-    def test_interval_must_be_positive(self) -> None:
+    @pytest.mark.parametrize("interval", [-1.0, 0], ids=["negative", "zero"])
+    def test_interval_must_be_positive(self, interval: float) -> None:
         """Test that interval must be positive."""
-        with pytest.raises(pydantic.ValidationError) as exc_info:
+        # The error location is printed on its own line, so this matches loc == ("interval",).
+        with pytest.raises(pydantic.ValidationError, match=r"(?m)^interval$"):
             models.Check(
                 name="test",
                 executor=models.Executor(command="echo"),
                 parser=models.Parser(),
-                publisher=models.UptimeKumaPublisher(
-                    url=pydantic.HttpUrl("https://my_url.net"), push_token=pydantic.SecretStr("test_token")
-                ),
-                schedule=models.Schedule(interval=-1.0),
+                publisher=_PUBLISHER,
+                schedule=models.Schedule(interval=interval),
             )
-        errors = exc_info.value.errors()
-        assert any(e["loc"] == ("interval",) for e in errors)
-
-    def test_interval_zero_invalid(self) -> None:
-        """Test that zero interval is invalid."""
-        with pytest.raises(pydantic.ValidationError) as exc_info:
-            models.Check(
-                name="test",
-                executor=models.Executor(command="echo"),
-                parser=models.Parser(),
-                publisher=models.UptimeKumaPublisher(
-                    url=pydantic.HttpUrl("https://my_url.net"), push_token=pydantic.SecretStr("test_token")
-                ),
-                schedule=models.Schedule(interval=0),
-            )
-        errors = exc_info.value.errors()
-        assert any(e["loc"] == ("interval",) for e in errors)
 
     def test_check_serialization(self) -> None:
         """Test that Check can be serialized and deserialized."""
@@ -97,9 +83,7 @@ class TestCheckModel:
             name="ser_check",
             executor=models.Executor(command="test", args=["arg1"], env={"KEY": "value"}),
             parser=models.Parser(),
-            publisher=models.UptimeKumaPublisher(
-                url=pydantic.HttpUrl("https://my_url.net"), push_token=pydantic.SecretStr("test_token")
-            ),
+            publisher=_PUBLISHER,
             schedule=models.Schedule(interval=45),
         )
 
@@ -122,7 +106,7 @@ class TestPublisherModels:
     def test_create_uptime_kuma_missing_url(self) -> None:
         """Test that UptimeKumaPublisher requires url field."""
         with pytest.raises(pydantic.ValidationError, match="url"):
-            models.UptimeKumaPublisher(push_token=pydantic.SecretStr("test_token"))  # type: ignore[call-arg]
+            models.UptimeKumaPublisher(push_token=_TEST_TOKEN)  # type: ignore[call-arg]
 
     def test_create_uptime_kuma_missing_push_token(self) -> None:
         """Test that UptimeKumaPublisher requires push_token field."""
@@ -19,7 +19,7 @@ class TestExecutorFactory:
 
     def test_factory(self) -> None:
         """Test that the factory returns the correct Executor."""
-        with pytest.raises(ValueError, match="Unknown executor: unknown"):
+        with pytest.raises(ValueError, match=r"^Unknown executor: unknown$"):
             executors.get_executor(name="unknown")
 
         executor = executors.get_executor(name="process")
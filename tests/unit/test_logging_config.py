@@ -11,7 +11,10 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import threading
+import time
 import typing
 from unittest import mock
 
@@ -28,10 +31,25 @@ def isolate_logging() -> typing.Iterator[None]:
     logging.root.handlers = []
     structlog.reset_defaults()
     yield
+    for handler in logging.root.handlers:
+        handler.close()  # Stop any background listener threads.
     logging.root.handlers = []
     structlog.reset_defaults()
 
 
+class _CaptureHandler(logging.Handler):
+    """Handler that records formatted lines and the threads that emitted them."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.lines: list[str] = []
+        self.threads: set[int] = set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.lines.append(self.format(record))
+        self.threads.add(threading.get_ident())
+
+
 def _assert_logging_configured(expected_level: int, *, structured: bool = False) -> None:
     """Verify logging configuration.
 
@@ -79,6 +97,105 @@ def test_configure_logging_structured() -> None:
         _assert_logging_configured(logging.INFO, structured=True)
 
 
+def test_configure_logging_structured_uses_orjson() -> None:
+    """Test that structured logs are serialized with orjson when it is available."""
+    orjson = pytest.importorskip("orjson")
+    with mock.patch("logging.StreamHandler") as stream_handler:
+        configure_logging(level="INFO", structured=True)
+        formatter = stream_handler.return_value.setFormatter.call_args.args[0]
+
+    event = {"event": "test message", "key": "value"}
+    rendered = formatter.processors[-1](None, "info", event.copy())
+    assert isinstance(rendered, str)
+    assert orjson.loads(rendered) == event
+
+
+def test_configure_logging_orjson_handles_what_it_cannot_serialize() -> None:
+    """Test that events with non-string keys or very large integers are still logged when orjson is available."""
+    pytest.importorskip("orjson")
+    capture = _CaptureHandler()
+    with mock.patch("logging.StreamHandler", return_value=capture):
+        configure_logging(level="INFO", structured=True)
+
+    structlog.get_logger("test").info("int keys", counts={1: 2})
+    structlog.get_logger("test").info("big int", n=2**70)
+    logging.root.handlers[0].close()  # Flush the queue.
+
+    first, second = (json.loads(line) for line in capture.lines)
+    assert first["counts"] == {"1": 2}
+    assert second["n"] == 2**70
+
+
+def test_configure_logging_writes_from_background_thread() -> None:
+    """Test that records are queued and rendered by the stream handler on a listener thread."""
+    capture = _CaptureHandler()
+    with mock.patch("logging.StreamHandler", return_value=capture):
+        configure_logging(level="INFO", structured=True)
+
+    structlog.get_logger("test").info("structlog message", key="value")
+    logging.getLogger("test").warning("stdlib message")
+    logging.getLogger("test").debug("filtered message")
+    logging.root.handlers[0].close()  # Flush the queue.
+
+    assert [json.loads(line)["event"] for line in capture.lines] == ["structlog message", "stdlib message"]
+    assert json.loads(capture.lines[0])["key"] == "value"
+    assert all(isinstance(json.loads(line)["timestamp"], float) for line in capture.lines)
+    assert threading.get_ident() not in capture.threads
+
+
+def test_configure_logging_console_renders_exceptions() -> None:
+    """Test that console mode still renders the traceback of log.exception() calls on the listener thread."""
+    capture = _CaptureHandler()
+    with mock.patch("logging.StreamHandler", return_value=capture):
+        configure_logging(level="INFO", structured=False)
+
+    try:
+        1 / 0  # noqa: B018
+    except ZeroDivisionError:
+        structlog.get_logger("test").exception("boom")
+    logging.root.handlers[0].close()  # Flush the queue.
+
+    assert len(capture.lines) == 1
+    assert "boom" in capture.lines[0]
+    assert "ZeroDivisionError" in capture.lines[0]
+
+
+def test_configure_logging_foreign_records_keep_caller_context() -> None:
+    """Test that stdlib records get the caller's contextvars and their creation time, not the listener's."""
+    capture = _CaptureHandler()
+    with mock.patch("logging.StreamHandler", return_value=capture):
+        configure_logging(level="INFO", structured=True)
+
+    with structlog.contextvars.bound_contextvars(request_id="abc"):
+        logging.getLogger("test").warning("stdlib message")
+    logged_by = time.time()
+    time.sleep(0.01)  # Render noticeably later than the record was created.
+    logging.root.handlers[0].close()  # Flush the queue.
+
+    event = json.loads(capture.lines[0])
+    assert event["request_id"] == "abc"
+    assert event["timestamp"] <= logged_by
+
+
+@pytest.mark.parametrize("callsite", [False, True])
+def test_configure_logging_callsite(*, callsite: bool) -> None:
+    """Test that callsite details are only added when requested; process and thread IDs are always added."""
+    capture = _CaptureHandler()
+    with mock.patch("logging.StreamHandler", return_value=capture):
+        configure_logging(level="INFO", structured=True, callsite=callsite)
+
+    structlog.get_logger("test").info("structlog message")
+    logging.getLogger("test").warning("stdlib message")
+    logging.root.handlers[0].close()  # Flush the queue.
+
+    for line in capture.lines:
+        event = json.loads(line)
+        assert event["thread"] == threading.get_ident()
+        assert "process" in event
+        assert ("func_name" in event) is callsite
+        assert ("lineno" in event) is callsite
+
+
 def test_configure_logging_custom_levels() -> None:
     """Test logging configuration with different log levels."""
     test_cases = [
@@ -125,3 +242,14 @@ def test_configure_logging_reset() -> None:
         # Should have only one handler (previous one was cleared)
         assert len(root2.handlers) == 1
         assert root2.level == logging.WARNING
+
+
+def test_configure_logging_repeated_calls_keep_one_handler() -> None:
+    """Test that reconfiguring replaces the queue handler and stops its listener thread instead of accumulating them."""
+    threads_before = threading.active_count()
+    with mock.patch("logging.StreamHandler"):
+        for level in ("DEBUG", "INFO", "WARNING"):
+            configure_logging(level=level, structured=True)
+
+    assert len(logging.getLogger().handlers) == 1
+    assert threading.active_count() == threads_before + 1
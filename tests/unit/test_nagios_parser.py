@@ -16,6 +16,46 @@ import pytest
 
 from kumacub.infrastructure import parsers
 
+_MULTILINE_OUTPUT = """
+        DISK WARNING - free space: 10%
+        /: 90% used
+        /home: 5% used
+        """
+
+_MULTILINE_PERFDATA_OUTPUT = """
+        DISK CRITICAL - free space: 95%
+        /: 95% used | /=95%;80;90
+        /home: 80% used | /home=80%;85;95
+        Additional performance data | metric1=42;50;75 metric2=30;50;75
+        """
+
+_WHITESPACE_OUTPUT = "  DISK OK - free space: 42%  |  /=42%;80;90  \n  /: 42% used  "
+
+_API_SPEC_OUTPUT = textwrap.dedent("""
+    TEXT OUTPUT | OPTIONAL PERFDATA
+    LONG TEXT LINE 1
+    LONG TEXT LINE 2
+    LONG TEXT LINE N | PERFDATA LINE 2
+    PERFDATA LINE 3
+    PERFDATA LINE N
+    """)
+
+
+@pytest.fixture(scope="module")
+def nagios_parser() -> parsers.ParserP:
+    """Return the Nagios parser, shared by all tests in the module."""
+    return parsers.get_parser("nagios")
+
+
+def _parse(
+    parser: parsers.ParserP, output: str, exit_code: parsers.nagios.NagiosExitCode = 0
+) -> parsers.NagiosParserOutput:
+    """Parse the output with the given parser."""
+    return cast(
+        "parsers.NagiosParserOutput",
+        parser.parse(parsers.NagiosParserArgs(id="test-check", exit_code=exit_code, output=output)),
+    )
+
 
 class TestNagiosParser:
     """Tests for _NagiosParser class."""
@@ -29,152 +69,66 @@ class TestNagiosParser:
             (3, "UNKNOWN"),
         ],
     )
-    def test_exit_code_mapping(self, exit_code: parsers.nagios.NagiosExitCode, expected_state: str) -> None:
+    def test_exit_code_mapping(
+        self, nagios_parser: parsers.ParserP, exit_code: parsers.nagios.NagiosExitCode, expected_state: str
+    ) -> None:
         """Test that exit codes are correctly mapped to service states."""
-        result = cast(
-            "parsers.NagiosParserOutput",
-            parsers.get_parser("nagios").parse(
-                parsers.NagiosParserArgs(
-                    id="test-check",
-                    exit_code=exit_code,
-                    output="Test output",
-                )
-            ),
-        )
+        result = _parse(nagios_parser, "Test output", exit_code=exit_code)
         assert result.service_state == expected_state
         assert result.exit_code == exit_code
 
-    def test_empty_output(self) -> None:
+    def test_empty_output(self, nagios_parser: parsers.ParserP) -> None:
         """Test with empty output."""
-        result = cast(
-            "parsers.NagiosParserOutput",
-            parsers.get_parser("nagios").parse(
-                parsers.NagiosParserArgs(
-                    id="test-check",
-                    exit_code=0,
-                    output="",
-                )
-            ),
-        )
+        result = _parse(nagios_parser, "")
         assert result.exit_code == 0
         assert result.service_state == "OK"
         assert result.service_output == ""
         assert result.service_performance_data == ""
         assert result.long_service_output == ""
 
-    def test_simple_output(self) -> None:
+    def test_simple_output(self, nagios_parser: parsers.ParserP) -> None:
         """Test with simple output (no performance data)."""
         output = "Everything is fine"
-        result = cast(
-            "parsers.NagiosParserOutput",
-            parsers.get_parser("nagios").parse(
-                parsers.NagiosParserArgs(
-                    id="test-check",
-                    exit_code=0,
-                    output=output,
-                )
-            ),
-        )
+        result = _parse(nagios_parser, output)
         assert result.service_output == output
         assert result.service_performance_data == ""
         assert result.long_service_output == ""
 
-    def test_with_performance_data(self) -> None:
+    def test_with_performance_data(self, nagios_parser: parsers.ParserP) -> None:
         """Test with performance data in the first line."""
-        output = "DISK OK - free space: 42% | /=42%;80;90"
-        result = cast(
-            "parsers.NagiosParserOutput",
-            parsers.get_parser("nagios").parse(
-                parsers.NagiosParserArgs(
-                    id="test-check",
-                    exit_code=0,
-                    output=output,
-                )
-            ),
-        )
+        result = _parse(nagios_parser, "DISK OK - free space: 42% | /=42%;80;90")
         assert result.service_output == "DISK OK - free space: 42%"
         assert result.service_performance_data == "/=42%;80;90"
 
-    def test_with_multiline_output(self) -> None:
+    def test_with_multiline_output(self, nagios_parser: parsers.ParserP) -> None:
         """Test with multiple lines of output."""
-        output = """
-        DISK WARNING - free space: 10%
-        /: 90% used
-        /home: 5% used
-        """
-        result = cast(
-            "parsers.NagiosParserOutput",
-            parsers.get_parser("nagios").parse(
-                parsers.NagiosParserArgs(
-                    id="test-check",
-                    exit_code=1,  # WARNING
-                    output=output,
-                )
-            ),
-        )
+        result = _parse(nagios_parser, _MULTILINE_OUTPUT, exit_code=1)  # WARNING
         assert result.service_output == "DISK WARNING - free space: 10%"
         assert result.long_service_output == "/: 90% used\n/home: 5% used"
         assert result.service_performance_data == ""
 
-    def test_with_performance_data_in_multiple_lines(self) -> None:
+    def test_with_performance_data_in_multiple_lines(self, nagios_parser: parsers.ParserP) -> None:
         """Test with performance data in multiple lines."""
-        output = """
-        DISK CRITICAL - free space: 95%
-        /: 95% used | /=95%;80;90
-        /home: 80% used | /home=80%;85;95
-        Additional performance data | metric1=42;50;75 metric2=30;50;75
-        """
-        result = cast(
-            "parsers.NagiosParserOutput",
-            parsers.get_parser("nagios").parse(
-                parsers.NagiosParserArgs(
-                    id="test-check",
-                    exit_code=2,  # CRITICAL
-                    output=output,
-                )
-            ),
-        )
+        result = _parse(nagios_parser, _MULTILINE_PERFDATA_OUTPUT, exit_code=2)  # CRITICAL
         assert result.service_output == "DISK CRITICAL - free space: 95%"
         assert result.long_service_output == "/: 95% used\n/home: 80% used\nAdditional performance data"
         assert result.service_performance_data == "/=95%;80;90 /home=80%;85;95 metric1=42;50;75 metric2=30;50;75"
 
-    def test_with_whitespace(self) -> None:
+    def test_with_whitespace(self, nagios_parser: parsers.ParserP) -> None:
         """Test that whitespace is properly handled."""
-        output = "  DISK OK - free space: 42%  |  /=42%;80;90  \n  /: 42% used  "
-        result = cast(
-            "parsers.NagiosParserOutput",
-            parsers.get_parser("nagios").parse(
-                parsers.NagiosParserArgs(
-                    id="test-check",
-                    exit_code=0,
-                    output=output,
-                )
-            ),
-        )
+        result = _parse(nagios_parser, _WHITESPACE_OUTPUT)
         assert result.service_output == "DISK OK - free space: 42%"
         assert result.service_performance_data == "/=42%;80;90"
         assert result.long_service_output == "/: 42% used"
 
-    def test_from_api_spec(self) -> None:
+    def test_from_api_spec(self, nagios_parser: parsers.ParserP) -> None:
         """Test contrived output from API spec."""
-        output = textwrap.dedent("""
-        TEXT OUTPUT | OPTIONAL PERFDATA
-        LONG TEXT LINE 1
-        LONG TEXT LINE 2
-        LONG TEXT LINE N | PERFDATA LINE 2
-        PERFDATA LINE 3
-        PERFDATA LINE N
-        """)
-        result = cast(
-            "parsers.NagiosParserOutput",
-            parsers.get_parser("nagios").parse(
-                parsers.NagiosParserArgs(
-                    id="test-check",
-                    exit_code=0,
-                    output=output,
-                )
-            ),
-        )
+        result = _parse(nagios_parser, _API_SPEC_OUTPUT)
         assert result.service_output == "TEXT OUTPUT"
         assert result.service_performance_data == "OPTIONAL PERFDATA PERFDATA LINE 2 PERFDATA LINE 3 PERFDATA LINE N"
         assert result.long_service_output == "LONG TEXT LINE 1\nLONG TEXT LINE 2\nLONG TEXT LINE N"
+
+    def test_output_passes_validation(self, nagios_parser: parsers.ParserP) -> None:
+        """Test that the (unvalidated) parser output is identical to a validated model."""
+        result = _parse(nagios_parser, "CRITICAL - down | t=1\nmore\n| x=2", exit_code=2)
+        assert parsers.NagiosParserOutput.model_validate(result.model_dump()) == result
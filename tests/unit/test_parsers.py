@@ -19,8 +19,12 @@ class TestParserFactory:
 
     def test_factory(self) -> None:
         """Test that the factory returns the correct parser."""
-        with pytest.raises(ValueError, match="Unknown parser: unknown"):
+        with pytest.raises(ValueError, match=r"^Unknown parser: unknown$"):
             parsers.get_parser(name="unknown")
 
         parser = parsers.get_parser(name="nagios")
         assert parser.name == "nagios"
+
+    def test_factory_reuses_instance(self) -> None:
+        """Test that the factory returns one shared instance per parser name."""
+        assert parsers.get_parser(name="nagios") is parsers.get_parser(name="nagios")
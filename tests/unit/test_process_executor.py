@@ -7,14 +7,15 @@
 #  You should have received a copy of the GNU General Public License along with this program.
 #  If not, see <https://www.gnu.org/licenses/>.
 
-"""Integration tests for ProcessExecutor class.
+"""Tests for ProcessExecutor class.
 
-These tests execute real subprocesses to verify end-to-end behavior.
+A single smoke test executes a real subprocess to verify end-to-end behavior; the rest mock subprocess.run.
 """
 
 from __future__ import annotations
 
-import asyncio
+import subprocess
+import threading
 from typing import TYPE_CHECKING, cast
 from unittest import mock
 
@@ -27,16 +28,14 @@ if TYPE_CHECKING:
 
 
 class TestProcessExecutor:
-    """Integration tests for executors.ExecutorP with real subprocess execution."""
+    """Tests for executors.ExecutorP; only the smoke test spawns a real subprocess."""
 
     @pytest.fixture
     def executor(self, monkeypatch: pytest.MonkeyPatch) -> executors.ExecutorP:
         """Return a executors.ExecutorP instance with mocked logger."""
         # Patch the logger to avoid issues with test environment
         mock_logger = mock.MagicMock()
-        monkeypatch.setattr(
-            "kumacub.infrastructure.executors.process_executor.structlog.get_logger", lambda: mock_logger
-        )
+        monkeypatch.setattr("kumacub.infrastructure.executors.process_executor._logger", mock_logger)
         return executors.get_executor("process")
 
     @pytest.fixture
@@ -58,17 +57,37 @@ class TestProcessExecutor:
     async def test_run_success(
         self, executor: executors.ExecutorP, exec_success: executors.ProcessExecutorArgs
     ) -> None:
-        """Test running a successful command."""
+        """Test running a successful command (in a real subprocess)."""
         result = cast("executors.ProcessExecutorOutput", await executor.run(args=exec_success))
 
         assert result.exit_code == 0
         assert result.stdout == "test output"
         assert result.stderr == ""
 
+    @pytest.mark.asyncio
+    async def test_run_uses_dedicated_thread(
+        self, executor: executors.ExecutorP, exec_success: executors.ProcessExecutorArgs
+    ) -> None:
+        """Test that processes run on the executor's own worker thread, not the event loop's default pool."""
+        threads: list[str] = []
+
+        def fake_run(*_args: object, **_kwargs: object) -> subprocess.CompletedProcess[bytes]:
+            threads.append(threading.current_thread().name)
+            return subprocess.CompletedProcess(args=[], returncode=0, stdout=b"", stderr=b"")
+
+        with mock.patch.object(subprocess, "run", side_effect=fake_run):
+            await executor.run(args=exec_success)
+            await executor.run(args=exec_success)
+
+        assert len(set(threads)) == 1
+        assert threads[0].startswith("kumacub-check")
+
     @pytest.mark.asyncio
     async def test_run_error(self, executor: executors.ExecutorP, exec_fail: executors.ProcessExecutorArgs) -> None:
         """Test running a command that returns non-zero exit code."""
-        result = cast("executors.ProcessExecutorOutput", await executor.run(args=exec_fail))
+        with mock.patch("subprocess.run") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=1, stdout=b"", stderr=b"")
+            result = cast("executors.ProcessExecutorOutput", await executor.run(args=exec_fail))
 
         assert result.exit_code == 1
         assert result.stdout == ""
@@ -81,7 +100,10 @@ class TestProcessExecutor:
         exec_not_found: executors.ProcessExecutorArgs,
     ) -> None:
         """Test running a non-existent command."""
-        with pytest.raises(FileNotFoundError):
+        with (
+            mock.patch.object(subprocess, "run", side_effect=FileNotFoundError(exec_not_found.command)),
+            pytest.raises(FileNotFoundError),
+        ):
             await executor.run(args=exec_not_found)
 
     @pytest.mark.asyncio
@@ -90,16 +112,17 @@ class TestProcessExecutor:
         executor: executors.ExecutorP,
         exec_success: executors.ProcessExecutorArgs,
     ) -> None:
-        """Test command timeout handling."""
-        with (
-            mock.patch.object(
-                asyncio,
-                "create_subprocess_exec",
-                side_effect=TimeoutError("Command timed out"),
-            ),
-            pytest.raises(TimeoutError),
-        ):
-            await executor.run(args=exec_success)
+        """Test that a timed-out command is reported as an UNKNOWN result instead of raising."""
+        exec_success = exec_success.model_copy(update={"timeout": 2.5})
+        with mock.patch.object(
+            subprocess, "run", side_effect=subprocess.TimeoutExpired(cmd="echo", timeout=2.5)
+        ) as mock_run:
+            result = cast("executors.ProcessExecutorOutput", await executor.run(args=exec_success))
+
+        assert mock_run.call_args.kwargs["timeout"] == 2.5
+        assert result.exit_code == 3
+        assert result.stdout == ""
+        assert result.stderr == "Check timed out after 2.5 seconds"
 
     @pytest.mark.asyncio
     async def test_run_with_environment(
@@ -112,16 +135,15 @@ class TestProcessExecutor:
         monkeypatch.setenv("TEST_VAR", "test_value")
         exec_success = exec_success.model_copy(update={"env": {"CUSTOM_VAR": "custom_value"}})
 
-        with mock.patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_proc = mock.AsyncMock()
-            mock_proc.communicate.return_value = (b"test output", b"")
-            mock_proc.returncode = 0
-            mock_exec.return_value = mock_proc
+        with mock.patch("subprocess.run") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess(
+                args=[], returncode=0, stdout=b"test output", stderr=b""
+            )
 
             await executor.run(exec_success)
 
             # Check that the environment variables were passed correctly
-            _, kwargs = mock_exec.call_args
+            _, kwargs = mock_run.call_args
             env = kwargs.get("env", {})
             assert env.get("CUSTOM_VAR") == "custom_value"
             assert "TEST_VAR" not in env  # Shouldn't inherit from parent env
@@ -133,13 +155,28 @@ class TestProcessExecutor:
         exec_success: executors.ProcessExecutorArgs,
     ) -> None:
         """Test running a command that writes to stderr."""
-        with mock.patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_proc = mock.AsyncMock()
-            mock_proc.communicate.return_value = (b"test output", b"error message")
-            mock_proc.returncode = 0
-            mock_exec.return_value = mock_proc
+        with mock.patch("subprocess.run") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess(
+                args=[], returncode=0, stdout=b"test output", stderr=b"error message"
+            )
             result = await executor.run(args=exec_success)
 
         assert result.exit_code == 0
         assert result.stdout == "test output"
         assert result.stderr == "error message"
+
+    @pytest.mark.asyncio
+    async def test_run_with_invalid_utf8(
+        self,
+        executor: _ProcessExecutor,
+        exec_success: executors.ProcessExecutorArgs,
+    ) -> None:
+        """Test that output which is not valid UTF-8 is decoded with replacement characters."""
+        with mock.patch("subprocess.run") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess(
+                args=[], returncode=0, stdout=b"OK - caf\xe9 | t=1\n", stderr=b""
+            )
+            result = await executor.run(args=exec_success)
+
+        assert result.stdout == "OK - caf\ufffd | t=1"
+        assert result.stderr == ""
@@ -20,7 +20,7 @@ class TestPublisherFactory:
 
     def test_factory(self) -> None:
         """Test that the factory returns the correct publisher."""
-        with pytest.raises(ValueError, match="Unknown publisher: unknown"):
+        with pytest.raises(ValueError, match=r"^Unknown publisher: unknown$"):
             publishers.get_publisher(name="unknown")
 
         publisher = publishers.get_publisher(name="uptime_kuma")
@@ -147,22 +147,54 @@ class TestRunner:
         assert publisher_args.msg == parser_output.service_output
 
     @pytest.mark.asyncio
-    async def test_timer(self, runner: Runner) -> None:
-        """Test the timer functionality."""
-        # First call should return 0 and set start time
-        result1 = runner._timer()
-        assert result1 == 0.0
-        assert runner._start_time is not None
-
-        # Second call should return time elapsed since first call
-        result2 = runner._timer()
-        assert result2 > 0.0
-
-        # Third call should return time since second call
-        await asyncio.sleep(0.1)
-        result3 = runner._timer()
-        assert result3 > 0.0
-        assert result3 > result2  # Should be a very small duration
+    async def test_run_uses_current_executor_config(
+        self, runner: Runner, sample_check: models.Check, mock_executor: mock.MagicMock, mock_parser: mock.MagicMock
+    ) -> None:
+        """Test that each run builds executor args from the check it is given, even if the name is unchanged."""
+        mock_executor.run.return_value = executors.ProcessExecutorOutput(exit_code=0, stdout="OK", stderr="")
+        mock_parser.parse.return_value = parsers.NagiosParserOutput(
+            exit_code=0,
+            service_output="OK",
+            service_state="OK",
+            long_service_output="",
+            service_performance_data="",
+        )
+        updated_check = sample_check.model_copy(
+            update={"executor": models.Executor(command="updated", args=["-v"], timeout=5)}
+        )
+
+        await runner.run(sample_check)
+        await runner.run(updated_check)
+
+        first_args, second_args = (call.args[0] for call in mock_executor.run.call_args_list)
+        assert first_args.command == sample_check.executor.command
+        assert (second_args.command, second_args.args, second_args.timeout) == ("updated", ["-v"], 5)
+
+    @pytest.mark.asyncio
+    async def test_run_measures_ping(
+        self, runner: Runner, sample_check: models.Check, mock_executor: mock.MagicMock, mock_parser: mock.MagicMock
+    ) -> None:
+        """Test that the ping covers the check execution, independently for concurrent runs."""
+
+        async def slow_run(_args: executors.ProcessExecutorArgs) -> executors.ProcessExecutorOutput:
+            await asyncio.sleep(0.1)
+            return executors.ProcessExecutorOutput(exit_code=0, stdout="OK", stderr="")
+
+        mock_executor.run.side_effect = slow_run
+        mock_parser.parse.return_value = parsers.NagiosParserOutput(
+            exit_code=0,
+            service_output="OK",
+            service_state="OK",
+            long_service_output="",
+            service_performance_data="",
+        )
+
+        await asyncio.gather(runner.run(sample_check), runner.run(sample_check))
+
+        pings = [call.kwargs["args"].ping for call in runner._publisher.publish.await_args_list]  # type: ignore[attr-defined]
+        assert len(pings) == 2
+        # asyncio.sleep() can wake slightly early on coarse monotonic clocks (e.g. Windows), so allow some slack.
+        assert all(90 <= ping < 1000 for ping in pings)
 
     @pytest.mark.asyncio
     async def test_run_with_stdout_publisher(
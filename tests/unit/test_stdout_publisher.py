@@ -75,6 +75,29 @@ class TestStdoutPublisher:
         output = json.loads(captured.out.strip())
         assert output["msg"] == message  # Should be unchanged
 
+    @pytest.mark.asyncio
+    async def test_publish_compact_by_default(self, capsys: CaptureFixture[str]) -> None:
+        """Test that output is written as a single compact JSON line by default."""
+        args = StdoutPublishArgs(id="test_check", status="up", msg="All good")
+        publisher = _StdoutPublisher()
+
+        await publisher.publish(args)
+
+        captured = capsys.readouterr()
+        assert captured.out == args.model_dump_json() + "\n"
+
+    @pytest.mark.asyncio
+    async def test_publish_with_indent(self, capsys: CaptureFixture[str]) -> None:
+        """Test that the indent option pretty-prints the output."""
+        args = StdoutPublishArgs(id="test_check", status="up", msg="All good")
+        publisher = _StdoutPublisher(indent=2)
+
+        await publisher.publish(args)
+
+        captured = capsys.readouterr()
+        assert captured.out == args.model_dump_json(indent=2) + "\n"
+        assert json.loads(captured.out) == {"id": "test_check", "status": "up", "msg": "All good"}
+
 
 class TestStdoutPublisherIntegration:
     """Integration tests for the stdout publisher with the factory."""
@@ -9,28 +9,57 @@
 
 """Tests for the UptimeKumaPublisher class."""
 
-from typing import Any, Literal
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+from unittest import mock
 
 import httpx
 import pydantic
 import pytest
+import pytest_asyncio
 import respx
 
 from kumacub.infrastructure.publishers import uptime_kuma
 
+_PUSH_URL = "http://ignored/api/push/test-token"
+
+
+@pytest.fixture(scope="module")
+def respx_router() -> Iterator[respx.MockRouter]:
+    """Return a respx router that mocks HTTP transports for the whole module.
+
+    A successful push route (named "push") is registered once; tests can override it by registering the same URL.
+    """
+    # Unmatched requests still fail (assert_all_mocked); tests that need a route to be hit assert its call count.
+    with respx.mock(assert_all_called=False, assert_all_mocked=True) as router:
+        router.get(_PUSH_URL, name="push").respond(httpx.codes.OK, json={"ok": True})
+        yield router
+
+
+@pytest.fixture(autouse=True)
+def _reset_respx_router(respx_router: respx.MockRouter) -> Iterator[None]:
+    """Restore the module's routes and clear recorded calls after each test, keeping the transport patch installed."""
+    respx_router.snapshot()
+    yield
+    respx_router.rollback()
+
 
 class TestUptimeKumaPublisher:
     """Tests for UptimeKumaPublisher class."""
 
-    @pytest.fixture
-    def uptime_kuma_publisher(self) -> uptime_kuma._UptimeKumaPublisher:
+    @pytest_asyncio.fixture
+    async def uptime_kuma_publisher(self) -> AsyncIterator[uptime_kuma._UptimeKumaPublisher]:
         """Return a UptimeKumaPublisher instance for testing."""
-        return uptime_kuma._UptimeKumaPublisher()
+        publisher = uptime_kuma._UptimeKumaPublisher()
+        yield publisher
+        await publisher.aclose()
 
     @pytest.fixture
     def publish_args(self) -> uptime_kuma.UptimeKumaPublishArgs:
         """Return sample publish args for testing."""
-        return uptime_kuma.UptimeKumaPublishArgs(
+        # Trusted literal values, so skip validation; test_publish_parameters_serialization covers the validating path.
+        return uptime_kuma.UptimeKumaPublishArgs.model_construct(
             id="test-check",
             url=pydantic.HttpUrl("http://ignored"),
             push_token=pydantic.SecretStr("test-token"),
@@ -41,97 +70,173 @@ class TestUptimeKumaPublisher:
 
     @pytest.mark.asyncio
     async def test_publish_success(
-        self, uptime_kuma_publisher: uptime_kuma._UptimeKumaPublisher, publish_args: uptime_kuma.UptimeKumaPublishArgs
+        self,
+        respx_router: respx.MockRouter,
+        uptime_kuma_publisher: uptime_kuma._UptimeKumaPublisher,
+        publish_args: uptime_kuma.UptimeKumaPublishArgs,
     ) -> None:
         """Test successful publish."""
-        with respx.mock() as mock:
-            mock.get(f"{publish_args.url}api/push/test-token").respond(httpx.codes.OK, json={"ok": True})
-            await uptime_kuma_publisher.publish(publish_args)
-
-            # Verify the request was made with the correct parameters
-            request = mock.calls[0][0]
-            assert request.method == "GET"
-            assert request.url.path == "/api/push/test-token"
-            assert request.url.params["status"] == "up"
-            assert request.url.params["msg"] == "Test message"
-            assert request.url.params["ping"] == "42.5"
-            assert request.headers["accept"] == "application/json"
+        await uptime_kuma_publisher.publish(publish_args)
+
+        # Verify the request was made (once) with the correct parameters
+        assert respx_router["push"].call_count == 1
+        request = respx_router.calls[0][0]
+        assert request.method == "GET"
+        assert request.url.path == "/api/push/test-token"
+        assert request.url.params["status"] == "up"
+        assert request.url.params["msg"] == "Test message"
+        assert request.url.params["ping"] == "42.5"
+        assert request.headers["accept"] == "application/json"
+
+    def test_query_params(self, publish_args: uptime_kuma.UptimeKumaPublishArgs) -> None:
+        """Test that only the push query fields are serialized."""
+        assert publish_args.query_params() == {"status": "up", "msg": "Test message", "ping": 42.5}
 
     @pytest.mark.asyncio
-    async def test_publish_http_error_with_message(
-        self, uptime_kuma_publisher: uptime_kuma._UptimeKumaPublisher, publish_args: uptime_kuma.UptimeKumaPublishArgs
+    async def test_publish_reuses_client(
+        self,
+        respx_router: respx.MockRouter,
+        uptime_kuma_publisher: uptime_kuma._UptimeKumaPublisher,
+        publish_args: uptime_kuma.UptimeKumaPublishArgs,
     ) -> None:
-        """Test publish with HTTP error that includes a message (no exception raised)."""
-        with respx.mock() as mock:
-            mock.get(f"{publish_args.url}api/push/test-token").respond(
-                httpx.codes.NOT_FOUND, json={"ok": False, "msg": "Monitor not found or not active"}
-            )
-            await uptime_kuma_publisher.publish(publish_args)
-            # Ensure request happened
-            request = mock.calls[0][0]
-            assert request.url.path == "/api/push/test-token"
+        """Test that one HTTP client is reused across publishes and closed by aclose()."""
+        await uptime_kuma_publisher.publish(publish_args)
+        client = uptime_kuma_publisher._client
+        await uptime_kuma_publisher.publish(publish_args)
+
+        assert respx_router["push"].call_count == 2
+        assert client is not None
+        assert uptime_kuma_publisher._client is client
+
+        await uptime_kuma_publisher.aclose()
+        assert uptime_kuma_publisher._client is None
+        assert client.is_closed
 
     @pytest.mark.asyncio
-    async def test_publish_http_error_no_message(
-        self, uptime_kuma_publisher: uptime_kuma._UptimeKumaPublisher, publish_args: uptime_kuma.UptimeKumaPublishArgs
+    async def test_client_configuration(self, uptime_kuma_publisher: uptime_kuma._UptimeKumaPublisher) -> None:
+        """Test that the client is configured with connection limits and optional HTTP/2."""
+        with mock.patch("httpx.AsyncClient", wraps=httpx.AsyncClient) as client_cls:
+            uptime_kuma_publisher._get_client()
+
+        client_cls.assert_called_once()
+        assert client_cls.call_args.kwargs["http2"] == uptime_kuma._HTTP2
+        assert client_cls.call_args.kwargs["limits"] == uptime_kuma._LIMITS
+        assert "transport" not in client_cls.call_args.kwargs
+
+    @pytest.mark.asyncio
+    async def test_publish_uses_env_proxy(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        respx_router: respx.MockRouter,
+        uptime_kuma_publisher: uptime_kuma._UptimeKumaPublisher,
+        publish_args: uptime_kuma.UptimeKumaPublishArgs,
     ) -> None:
-        """Test publish with HTTP error that doesn't include a message (no exception raised)."""
-        with respx.mock() as mock:
-            mock.get(f"{publish_args.url}api/push/test-token").respond(
-                httpx.codes.INTERNAL_SERVER_ERROR, json={"ok": False, "msg": "Internal server error"}
-            )
-            await uptime_kuma_publisher.publish(publish_args)
-            request = mock.calls[0][0]
-            assert request.url.path == "/api/push/test-token"
+        """Test that pushes go through the proxy configured in the environment."""
+        request_lines: list[bytes] = []
+
+        async def proxy(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            request_lines.append((await reader.readuntil(b"\r\n\r\n")).split(b"\r\n", 1)[0])
+            writer.write(b'HTTP/1.1 200 OK\r\nContent-Length: 11\r\nConnection: close\r\n\r\n{"ok":true}')
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(proxy, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        monkeypatch.setenv("HTTP_PROXY", f"http://127.0.0.1:{port}")
+        for name in ("NO_PROXY", "no_proxy", "ALL_PROXY", "all_proxy"):
+            monkeypatch.delenv(name, raising=False)
+        respx_router.stop()  # respx cannot mock proxied requests; send this one for real, to the local proxy.
+        try:
+            async with server:
+                await uptime_kuma_publisher.publish(publish_args)
+        finally:
+            respx_router.start()
+
+        assert len(request_lines) == 1
+        assert request_lines[0].startswith(b"GET http://ignored/api/push/test-token?")
 
+    @pytest.mark.parametrize(
+        ("outcome", "expected_msg"),
+        [
+            (
+                httpx.Response(httpx.codes.NOT_FOUND, json={"ok": False, "msg": "Monitor not found or not active"}),
+                "Monitor not found or not active",
+            ),
+            (
+                httpx.Response(httpx.codes.INTERNAL_SERVER_ERROR, json={"ok": False, "msg": "Internal server error"}),
+                "Internal server error",
+            ),
+            (httpx.Response(httpx.codes.BAD_GATEWAY, text="<html>Bad Gateway</html>"), "Server returned error: 502"),
+            (httpx.RequestError("Connection error"), "Request failed: Connection error"),
+        ],
+        ids=["http_error_with_message", "http_error_server_message", "http_error_non_json", "request_error"],
+    )
     @pytest.mark.asyncio
-    async def test_publish_request_error(
-        self, uptime_kuma_publisher: uptime_kuma._UptimeKumaPublisher, publish_args: uptime_kuma.UptimeKumaPublishArgs
+    async def test_publish_failure(
+        self,
+        respx_router: respx.MockRouter,
+        publish_args: uptime_kuma.UptimeKumaPublishArgs,
+        outcome: httpx.Response | httpx.RequestError,
+        expected_msg: str,
     ) -> None:
-        """Test publish with request error (no exception raised)."""
-        with respx.mock() as mock:
-            mock.get(f"{publish_args.url}api/push/test-token").mock(side_effect=httpx.RequestError("Connection error"))
-            await uptime_kuma_publisher.publish(publish_args)
+        """Test that failed pushes are logged as warnings instead of raising."""
+        respx_router["push"].mock(side_effect=[outcome])  # Overrides the default route for this test only.
+        publisher = uptime_kuma._UptimeKumaPublisher()
+        with mock.patch.object(uptime_kuma, "_logger") as logger:
+            await publisher.publish(publish_args)
+        await publisher.aclose()
+
+        assert respx_router.calls.last.request.url.path == "/api/push/test-token"
+        logger.bind.return_value.warning.assert_called_once_with("Failed to push check result: %s", expected_msg)
+
+    @pytest.mark.parametrize(
+        ("response", "expected"),
+        [
+            (httpx.Response(httpx.codes.NOT_FOUND, json={"ok": False, "msg": "Not found"}), "Not found"),
+            (httpx.Response(httpx.codes.NOT_FOUND, json={"ok": False}), "Server returned error: 404"),
+            (httpx.Response(httpx.codes.NOT_FOUND, json=["unexpected"]), "Server returned error: 404"),
+            (httpx.Response(httpx.codes.BAD_GATEWAY, text="<html></html>"), "Server returned error: 502"),
+        ],
+    )
+    def test_error_message(self, response: httpx.Response, expected: str) -> None:
+        """Test that error messages are extracted from the response body when possible."""
+        assert uptime_kuma._UptimeKumaPublisher._error_message(response) == expected
 
     @pytest.mark.parametrize(
-        ("status", "msg", "ping", "expected_params"),
+        ("fields", "expected_params"),
         [
-            ("up", "Test", 1.0, {"status": "up", "msg": "Test", "ping": "1.0"}),
-            ("down", "", None, {"status": "down", "msg": ""}),
+            ({"status": "up", "msg": "Test", "ping": 1.0}, {"status": "up", "msg": "Test", "ping": "1.0"}),
+            ({"status": "down", "msg": "", "ping": None}, {"status": "down", "msg": ""}),
         ],
+        ids=["up-with-ping", "down-empty"],
     )
     @pytest.mark.asyncio
     async def test_publish_parameters_serialization(
         self,
+        respx_router: respx.MockRouter,
         uptime_kuma_publisher: uptime_kuma._UptimeKumaPublisher,
-        status: Literal["up", "down"],
-        msg: str,
-        ping: float | None,
+        fields: dict[str, Any],
         expected_params: dict[str, Any],
     ) -> None:
         """Test that push parameters are correctly serialized to query params."""
-        with respx.mock() as mock:
-            # Create parameters and make the request
-            args = uptime_kuma.UptimeKumaPublishArgs(
-                id="test-check",
-                url=pydantic.HttpUrl("http://ignored"),
-                push_token=pydantic.SecretStr("test-token"),
-                status=status,
-                msg=msg,
-                ping=ping,
-            )
-            # Mock the response using the URL from args
-            mock.get(f"{args.url}api/push/test-token").respond(httpx.codes.OK, json={"ok": True})
-            await uptime_kuma_publisher.publish(args)
-
-            # Get the request that was made
-            request = mock.calls[0][0]
-
-            # Check the URL and method
-            assert request.method == "GET"
-            assert request.url.path == "/api/push/test-token"
-
-            # Check that all expected parameters are present in the URL query string
-            for key, expected_value in expected_params.items():
-                if expected_value is not None:
-                    assert request.url.params[key] == expected_value
+        # Create parameters and make the request
+        args = uptime_kuma.UptimeKumaPublishArgs(
+            id="test-check",
+            url=pydantic.HttpUrl("http://ignored"),
+            push_token=pydantic.SecretStr("test-token"),
+            **fields,
+        )
+        # The successful push route is pre-registered on the module's router
+        await uptime_kuma_publisher.publish(args)
+
+        # Get the request that was made
+        request = respx_router.calls.last.request
+
+        # Check the URL and method
+        assert request.method == "GET"
+        assert request.url.path == "/api/push/test-token"
+
+        # Check that all expected parameters are present in the URL query string
+        for key, expected_value in expected_params.items():
+            if expected_value is not None:
+                assert request.url.params[key] == expected_value